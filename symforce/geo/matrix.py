@@ -5,6 +5,8 @@
 
 from __future__ import annotations
 
+import functools
+
 import numpy as np
 
 import symforce
@@ -66,15 +68,20 @@ class Matrix(Storage):
             7) Matrix22(1, 2, 3, 4)  # Matrix22 with [1, 2, 3, 4] data (must match fixed length)
         """
 
+        # Computed once up front - each is re-checked along the branch chain below, and this
+        # constructor is the hot path for the V*/M* convenience constructors
+        num_args = len(args)
+        is_fixed_size = cls._is_fixed_size()
+
         # 1) Default construction allowed for fixed size.
-        if len(args) == 0:
-            assert cls._is_fixed_size(), "Cannot default construct non-fixed matrix."
+        if num_args == 0:
+            assert is_fixed_size, "Cannot default construct non-fixed matrix."
             return cls.zero()
 
         # 2) Construct with another Matrix - this is easy
-        elif len(args) == 1 and hasattr(args[0], "is_Matrix") and args[0].is_Matrix:
+        elif num_args == 1 and hasattr(args[0], "is_Matrix") and args[0].is_Matrix:
             rows, cols = args[0].shape
-            if cls._is_fixed_size():
+            if is_fixed_size:
                 assert cls.SHAPE == (
                     rows,
                     cols,
@@ -82,7 +89,7 @@ class Matrix(Storage):
             flat_list = list(args[0])
 
         # 3) If there's one argument and it's an array, works for fixed or dynamic size.
-        elif len(args) == 1 and isinstance(args[0], (_T.Sequence, np.ndarray)):
+        elif num_args == 1 and isinstance(args[0], (_T.Sequence, np.ndarray)):
             array = args[0]
             # 2D array, shape is known
             if len(array) > 0 and isinstance(array[0], (_T.Sequence, np.ndarray)):
@@ -91,7 +98,7 @@ class Matrix(Storage):
                     array[0][0], Matrix
                 ), "Use Matrix.block_matrix to construct using matrices"
                 rows, cols = len(array), len(array[0])
-                if cls._is_fixed_size():
+                if is_fixed_size:
                     assert (
                         rows,
                         cols,
@@ -103,9 +110,9 @@ class Matrix(Storage):
 
             # 1D array - if fixed size this must match data length. If not, assume column vec.
             else:
-                if cls._is_fixed_size():
-                    assert len(array) == cls.storage_dim(), f"Gave args {args} for {cls}"
+                if is_fixed_size:
                     rows, cols = cls.SHAPE
+                    assert len(array) == rows * cols, f"Gave args {args} for {cls}"
                 else:
                     # Only set the second dimension to 1 if the array is nonempty
                     if len(array) == 0:
@@ -121,7 +128,7 @@ class Matrix(Storage):
         # here. We need it to fail because it's ambiguous in the case of sf.M21(10, 20) whether
         # the args are values or sizes. So I've overriden several operator methods to first convert
         # to an sm.Matrix, do the operation, then convert back.
-        elif len(args) == 2 and cls.SHAPE == (-1, -1):
+        elif num_args == 2 and cls.SHAPE == (-1, -1):
             rows, cols = args[0], args[1]
             assert isinstance(rows, int)
             assert isinstance(cols, int)
@@ -129,7 +136,7 @@ class Matrix(Storage):
 
         # 5) If there are two integer arguments and then a sequence, treat this as a shape and a
         # data list directly.
-        elif len(args) == 3 and isinstance(args[-1], (np.ndarray, _T.Sequence)):
+        elif num_args == 3 and isinstance(args[-1], (np.ndarray, _T.Sequence)):
             assert isinstance(args[0], int), args
             assert isinstance(args[1], int), args
             rows, cols = args[0], args[1]
@@ -138,7 +145,7 @@ class Matrix(Storage):
 
         # 6) Two integer arguments plus a callable to initialize values based on (row, col)
         # NOTE(hayk): sympy.Symbol is callable, hence the last check.
-        elif len(args) == 3 and callable(args[-1]) and not hasattr(args[-1], "is_Symbol"):
+        elif num_args == 3 and callable(args[-1]) and not hasattr(args[-1], "is_Symbol"):
             assert isinstance(args[0], int), args
             assert isinstance(args[1], int), args
             rows, cols = args[0], args[1]
@@ -147,7 +154,7 @@ class Matrix(Storage):
         # 7) If we have args equal to the fixed type, treat that as a convenience constructor like
         # Matrix31(1, 2, 3) which is the same as Matrix31(3, 1, [1, 2, 3]). Also works for
         # Matrix22([1, 2, 3, 4]).
-        elif cls._is_fixed_size() and len(args) == cls.storage_dim():
+        elif is_fixed_size and num_args == cls.SHAPE[0] * cls.SHAPE[1]:
             rows, cols = cls.SHAPE
             flat_list = list(args)
 
@@ -200,8 +207,9 @@ class Matrix(Storage):
 
     @classmethod
     def storage_dim(cls) -> int:
-        assert cls._is_fixed_size(), f"Type has no size info: {cls}"
-        return cls.SHAPE[0] * cls.SHAPE[1]
+        rows, cols = cls.SHAPE
+        assert rows > 0 and cols > 0, f"Type has no size info: {cls}"
+        return rows * cols
 
     @classmethod
     def from_storage(
@@ -211,14 +219,27 @@ class Matrix(Storage):
         if isinstance(vec, Matrix):
             vec = list(vec)
         rows, cols = cls.SHAPE
-        return _T.cast(Matrix.MatrixT, matrix_type_from_shape((cols, rows))(vec).transpose())
+        if rows == 1 or cols == 1:
+            # Column-major and row-major order agree for vectors, so skip the transpose round trip
+            return _T.cast(Matrix.MatrixT, cls(vec))
+        # Storage is column-major; reorder into a row-major flat list in a single pass instead of
+        # constructing the transposed matrix and transposing it
+        return _T.cast(
+            Matrix.MatrixT,
+            cls(rows, cols, [vec[col * rows + row] for row in range(rows) for col in range(cols)]),
+        )
 
     def to_storage(self) -> _T.List[_T.Scalar]:
+        if self.mat.rows == 1 or self.mat.cols == 1:
+            return list(self.mat)
         return list(self.mat.transpose())
 
     @classmethod
     def tangent_dim(cls) -> int:
-        return cls.storage_dim()
+        # Same as storage_dim, inlined to skip a classmethod dispatch in lie group op loops
+        rows, cols = cls.SHAPE
+        assert rows > 0 and cols > 0, f"Type has no size info: {cls}"
+        return rows * cols
 
     @classmethod
     def from_tangent(
@@ -245,7 +266,11 @@ class Matrix(Storage):
         Matrix of zeros.
         """
         assert cls._is_fixed_size(), f"Type has no size info: {cls}"
-        return cls.zeros(*cls.SHAPE)
+        rows, cols = cls.SHAPE
+        # The shape is known valid for cls, so go straight to the shared cached matrix
+        if rows <= _MAX_CACHED_DIM and cols <= _MAX_CACHED_DIM:
+            return cls(_zeros_sympy(rows, cols))
+        return cls.zeros(rows, cols)
 
     @classmethod
     def zeros(cls: _T.Type[MatrixT], rows: int, cols: int) -> MatrixT:
@@ -255,6 +280,8 @@ class Matrix(Storage):
         if cls._is_fixed_size() and cls.SHAPE != (rows, cols):
             raise TypeError(f"Called zeros({rows=}, {cols=}) on matrix of shape {cls.SHAPE}")
 
+        if 0 < rows <= _MAX_CACHED_DIM and 0 < cols <= _MAX_CACHED_DIM:
+            return cls(_zeros_sympy(rows, cols))
         return cls([[sf.S.Zero] * cols for _ in range(rows)])
 
     @classmethod
@@ -263,7 +290,10 @@ class Matrix(Storage):
         Matrix of ones.
         """
         assert cls._is_fixed_size(), f"Type has no size info: {cls}"
-        return cls.ones(*cls.SHAPE)
+        rows, cols = cls.SHAPE
+        if rows <= _MAX_CACHED_DIM and cols <= _MAX_CACHED_DIM:
+            return cls(_ones_sympy(rows, cols))
+        return cls.ones(rows, cols)
 
     @classmethod
     def ones(cls: _T.Type[MatrixT], rows: int, cols: int) -> MatrixT:
@@ -273,6 +303,8 @@ class Matrix(Storage):
         if cls._is_fixed_size() and cls.SHAPE != (rows, cols):
             raise TypeError(f"Called ones({rows=}, {cols=}) on matrix of shape {cls.SHAPE}")
 
+        if 0 < rows <= _MAX_CACHED_DIM and 0 < cols <= _MAX_CACHED_DIM:
+            return cls(_ones_sympy(rows, cols))
         return cls([[sf.S.One] * cols for _ in range(rows)])
 
     @classmethod
@@ -289,10 +321,8 @@ class Matrix(Storage):
                     f"Cannot call .diag() with a diagonal of length {len(diagonal)} on a matrix of shape {cls.SHAPE}"
                 )
 
-        mat = cls.zeros(len(diagonal), len(diagonal))
-        for i, x in enumerate(diagonal):
-            mat[i, i] = x
-        return mat
+        n = len(diagonal)
+        return cls([[diagonal[i] if i == j else sf.S.Zero for j in range(n)] for i in range(n)])
 
     # NOTE(aaron):  The following set of overloads is the correct signature for `eye`. However, when
     # I do this mypy thinks the signature is:
@@ -333,17 +363,18 @@ class Matrix(Storage):
         """
         if rows is None and cols is None:
             assert cls._is_fixed_size(), f"Type has no size info: {cls}"
-            return cls.eye(*cls.SHAPE)
+            rows, cols = cls.SHAPE
 
         if rows is None:
             raise ValueError("If cols is not None, rows must not be None")
 
         if cols is None:
             cols = rows
-        mat = cls.zeros(rows, cols)
-        for i in range(min(rows, cols)):
-            mat[i, i] = sf.S.One
-        return mat
+        if cls._is_fixed_size() and cls.SHAPE != (rows, cols):
+            raise TypeError(f"Called eye({rows=}, {cols=}) on matrix of shape {cls.SHAPE}")
+        if 0 < rows <= _MAX_CACHED_DIM and 0 < cols <= _MAX_CACHED_DIM:
+            return cls(_eye_sympy(rows, cols))
+        return cls([[sf.S.One if i == j else sf.S.Zero for j in range(cols)] for i in range(rows)])
 
     def det(self) -> _T.Scalar:
         """
@@ -369,27 +400,17 @@ class Matrix(Storage):
         assert cls._is_fixed_size(), f"Type has no size info: {cls}"
         rows, cols = cls.SHAPE
 
-        row_names = [str(r_i) for r_i in range(rows)]
-        col_names = [str(c_i) for c_i in range(cols)]
-
-        assert len(row_names) == rows
-        assert len(col_names) == cols
-
         if cols == 1:
-            symbols = []
-            for r_i in range(rows):
-                _name = "{}{}".format(name, row_names[r_i])
-                symbols.append([sf.Symbol(_name, **kwargs)])
+            names = [f"{name}{r_i}" for r_i in range(rows)]
         else:
-            symbols = []
-            for r_i in range(rows):
-                col_symbols = []
-                for c_i in range(cols):
-                    _name = "{}{}_{}".format(name, row_names[r_i], col_names[c_i])
-                    col_symbols.append(sf.Symbol(_name, **kwargs))
-                symbols.append(col_symbols)
+            names = [f"{name}{r_i}_{c_i}" for r_i in range(rows) for c_i in range(cols)]
 
-        return cls(sf.sympy.Matrix(symbols))
+        # Don't batch through sf.sympy.symbols here - it runs every name through sympy's string
+        # mini-language (whitespace/comma splitting, `:` range expansion), which corrupts names
+        # that are valid literal identifiers for sf.Symbol.
+        symbols = [sf.Symbol(n, **kwargs) for n in names]
+
+        return cls(sf.sympy.Matrix(rows, cols, symbols))
 
     def row_join(self, right: Matrix) -> Matrix:
         """
@@ -556,7 +577,7 @@ class Matrix(Storage):
         Squared norm of a vector, equivalent to the dot product with itself.
         """
         self._assert_is_vector()
-        return self.dot(self)
+        return sf.Add(*[x * x for x in self.mat])
 
     def norm(self, epsilon: _T.Scalar = sf.epsilon()) -> _T.Scalar:
         """
@@ -568,7 +589,8 @@ class Matrix(Storage):
         """
         Returns a unit vector in this direction (divide by norm).
         """
-        return self / self.norm(epsilon=epsilon)
+        # One divide and N multiplies, instead of N divides
+        return self * (sf.S.One / self.norm(epsilon=epsilon))
 
     def clamp_norm(
         self: MatrixT, max_norm: _T.Scalar, epsilon: _T.Scalar = sf.epsilon()
@@ -606,7 +628,8 @@ class Matrix(Storage):
         """
         Apply a unary operation to every scalar.
         """
-        return self.__class__(self.mat.applyfunc(func))
+        # Build the result in one flat pass; sympy's applyfunc goes through per-entry __setitem__
+        return self.__class__(self.rows, self.cols, [func(x) for x in self.mat])
 
     # Dummy __iter__ method for mypy
     # Matrix is Iterable because it implements __getitem__(int), but mypy only recognizes __iter__:
@@ -665,7 +688,8 @@ class Matrix(Storage):
         Add a scalar or matrix to this matrix.
         """
         if typing_util.scalar_like(right):
-            return self.applyfunc(lambda x: x + right)
+            right_sym = sf.S(right)
+            return self.__class__(self.rows, self.cols, [x + right_sym for x in self.mat])
         elif isinstance(right, Matrix):
             return self.__class__(self.mat + right.mat)
         else:
@@ -676,7 +700,8 @@ class Matrix(Storage):
         Subtract a scalar or matrix from this matrix.
         """
         if typing_util.scalar_like(right):
-            return self.applyfunc(lambda x: x - right)
+            right_sym = sf.S(right)
+            return self.__class__(self.rows, self.cols, [x - right_sym for x in self.mat])
         elif isinstance(right, Matrix):
             return self.__class__(self.mat - right.mat)
         else:
@@ -699,7 +724,8 @@ class Matrix(Storage):
         Multiply a matrix by a scalar or matrix
         """
         if typing_util.scalar_like(right):
-            return self.applyfunc(lambda x: x * right)
+            right_sym = sf.S(right)
+            return self.__class__(self.rows, self.cols, [x * right_sym for x in self.mat])
         elif isinstance(right, Matrix):
             return Matrix(self.mat * right.mat)
         else:
@@ -722,7 +748,8 @@ class Matrix(Storage):
         Left multiply a matrix by a scalar or matrix
         """
         if typing_util.scalar_like(left):
-            return self.applyfunc(lambda x: left * x)
+            left_sym = sf.S(left)
+            return self.__class__(self.rows, self.cols, [left_sym * x for x in self.mat])
         elif isinstance(left, Matrix):
             return self.__class__(left.mat * self.mat)
         else:
@@ -745,7 +772,9 @@ class Matrix(Storage):
         Divide a matrix by a scalar or a matrix (which takes the inverse).
         """
         if typing_util.scalar_like(right):
-            return self.applyfunc(lambda x: x / sf.S(right))
+            # Compute the reciprocal once so the elementwise loop is multiplies, not divides
+            recip = sf.S.One / sf.S(right)
+            return self.__class__(self.rows, self.cols, [x * recip for x in self.mat])
         elif isinstance(right, Matrix):
             return self * right.inv()
         else:
@@ -843,7 +872,32 @@ class Matrix(Storage):
         """
         Returns 1 if a and b are parallel within tolerance, and 0 otherwise.
         """
-        return (1 - sf.sign(a.cross(b).squared_norm() - tolerance ** 2)) / 2
+        return Matrix.are_parallel_expr(a, b, tolerance)
+
+    @staticmethod
+    def are_parallel_expr(
+        a: Vector3,
+        b: Vector3,
+        tolerance: _T.Scalar,
+        cache: _T.Optional[_T.Dict[_T.Tuple[int, int], Vector3]] = None,
+    ) -> _T.Scalar:
+        """
+        Returns 1 if a and b are parallel within tolerance, and 0 otherwise.
+
+        If `cache` (a dict owned by the caller) is provided, the cross product for the pair
+        (a, b) is computed once and shared between calls with the same cache, so that repeated
+        parallel checks in one codegen pass reuse the cross product terms and cse() can collapse
+        them.
+        """
+        if cache is not None:
+            key = (id(a), id(b))
+            cross = cache.get(key)
+            if cross is None:
+                cross = a.cross(b)
+                cache[key] = cross
+        else:
+            cross = a.cross(b)
+        return (1 - sf.sign(cross.squared_norm() - tolerance ** 2)) / 2
 
     @staticmethod
     def skew_symmetric(a: Vector3) -> Matrix33:
@@ -856,7 +910,26 @@ class Matrix(Storage):
         """
         Perform numerical evaluation of each element in the matrix.
         """
-        return self.from_flat_list([ops.StorageOps.evalf(v) for v in self.to_flat_list()])
+        # Iterate the sympy matrix's flat storage with the evalf handle looked up once, instead
+        # of round-tripping through to_flat_list/from_flat_list
+        evalf_fn = ops.StorageOps.evalf
+        return self.__class__(self.rows, self.cols, [evalf_fn(v) for v in self.mat])
+
+    def _evalf_cse(self) -> Matrix:
+        """
+        Numerical evaluation of each element, sharing work between elements.
+
+        Matrices built from jacobians and lie group ops tend to repeat large subexpressions
+        across entries; running cse() first means each shared subexpression is evaluated once
+        instead of once per entry that contains it.
+        """
+        replacements, reduced = sf.cse(self.to_flat_list())
+        subs_map: _T.Dict[_T.Any, _T.Scalar] = {}
+        for symbol, expr in replacements:
+            subs_map[symbol] = ops.StorageOps.evalf(expr.subs(subs_map))
+        return self.__class__(
+            self.rows, self.cols, [ops.StorageOps.evalf(expr.subs(subs_map)) for expr in reduced]
+        )
 
     def to_list(self) -> _T.List[_T.List[_T.Scalar]]:
         """
@@ -879,7 +952,11 @@ class Matrix(Storage):
         """
         Convert to a numpy array.
         """
-        return np.array(self.evalf().to_flat_list(), dtype=scalar_type).reshape(self.shape)
+        out = np.empty(self.shape, dtype=scalar_type)
+        out_flat = out.flat
+        for i, v in enumerate(self._evalf_cse().mat):
+            out_flat[i] = v
+        return out
 
     @classmethod
     def column_stack(cls, *columns: Matrix) -> Matrix:
@@ -894,12 +971,14 @@ class Matrix(Storage):
         if not columns:
             return cls()
 
-        for col in columns:
-            # assert that each column is a vector
-            assert col.shape == columns[0].shape
-            assert sum(dim > 1 for dim in col.shape) <= 1
+        if __debug__:
+            for col in columns:
+                # assert that each column is a vector
+                assert col.shape == columns[0].shape
+                assert sum(dim > 1 for dim in col.shape) <= 1
 
-        return cls([col.to_flat_list() for col in columns]).T
+        # Build the stacked data row-major in one pass, rather than stacking rows and transposing
+        return cls([[col[i] for col in columns] for i in range(len(columns[0]))])
 
     def is_vector(self) -> bool:
         return (self.shape[0] == 1) or (self.shape[1] == 1)
@@ -960,6 +1039,42 @@ class Matrix(Storage):
                 latex_formatter.for_type(Matrix, lambda o: sympy_latex_formatter(o.mat))
 
 
+# -----------------------------------------------------------------------------
+# Cached constant matrices. sf.S.Zero and sf.S.One are immutable singletons, so
+# the sympy matrices built here are shared and handed to the (copying) Matrix
+# constructor, rather than rebuilding the nested list on every call. Only small
+# shapes are cached, matching the statically defined types below.
+# -----------------------------------------------------------------------------
+
+_MAX_CACHED_DIM = 9
+
+
+@functools.lru_cache(maxsize=None)
+def _zeros_sympy(rows: int, cols: int) -> sf.sympy.Matrix:
+    """
+    Shared sympy zero matrix of the given shape. Do not mutate.
+    """
+    return sf.sympy.Matrix(rows, cols, [sf.S.Zero] * (rows * cols))
+
+
+@functools.lru_cache(maxsize=None)
+def _ones_sympy(rows: int, cols: int) -> sf.sympy.Matrix:
+    """
+    Shared sympy matrix of ones of the given shape. Do not mutate.
+    """
+    return sf.sympy.Matrix(rows, cols, [sf.S.One] * (rows * cols))
+
+
+@functools.lru_cache(maxsize=None)
+def _eye_sympy(rows: int, cols: int) -> sf.sympy.Matrix:
+    """
+    Shared sympy matrix of the given shape with ones on the diagonal. Do not mutate.
+    """
+    return sf.sympy.Matrix(
+        rows, cols, [sf.S.One if i == j else sf.S.Zero for i in range(rows) for j in range(cols)]
+    )
+
+
 # -----------------------------------------------------------------------------
 # Statically define fixed matrix types. We could dynamically generate in a
 # loop but this is nice for IDE understanding and static analysis.
@@ -1489,16 +1604,25 @@ M89 = Matrix89
 M99 = Matrix99
 
 
+def _eye_ctor(cls: _T.Type[Matrix]) -> _T.Callable[[], Matrix]:
+    """
+    Specialized zero-argument identity constructor for cls, copying the shared cached identity
+    without going through the branchy `Matrix.eye` dispatch.
+    """
+    eye_mat = _eye_sympy(*cls.SHAPE)
+    return lambda: cls(eye_mat)
+
+
 # Identity convenience names
-I1 = I11 = M11.eye
-I2 = I22 = M22.eye
-I3 = I33 = M33.eye
-I4 = I44 = M44.eye
-I5 = I55 = M55.eye
-I6 = I66 = M66.eye
-I7 = I77 = M77.eye
-I8 = I88 = M88.eye
-I9 = I99 = M99.eye
+I1 = I11 = _eye_ctor(M11)
+I2 = I22 = _eye_ctor(M22)
+I3 = I33 = _eye_ctor(M33)
+I4 = I44 = _eye_ctor(M44)
+I5 = I55 = _eye_ctor(M55)
+I6 = I66 = _eye_ctor(M66)
+I7 = I77 = _eye_ctor(M77)
+I8 = I88 = _eye_ctor(M88)
+I9 = I99 = _eye_ctor(M99)
 
 
 # Register printing for ipython
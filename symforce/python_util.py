@@ -8,10 +8,12 @@ General python utilities.
 """
 import functools
 import inspect
+import logging
 import os
 import random
 import re
 import shutil
+import stat
 import string
 import subprocess
 
@@ -23,14 +25,19 @@ def remove_if_exists(path: T.Openable) -> None:
     """
     Delete a file or directory if it exists.
     """
-    if not os.path.exists(path):
-        logger.debug(f"Doesn't exist: {path}")
+    # One lstat instead of the separate exists/isdir checks. %-style args so the logger only
+    # formats when DEBUG is enabled.
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        logger.debug("Doesn't exist: %s", path)
         return
-    elif os.path.isdir(path):
-        logger.debug(f"Removing directory: {path}")
+
+    if stat.S_ISDIR(st.st_mode):
+        logger.debug("Removing directory: %s", path)
         shutil.rmtree(path)
     else:
-        logger.debug(f"Removing file: {path}")
+        logger.debug("Removing file: %s", path)
         os.remove(path)
 
 
@@ -44,6 +51,9 @@ def execute_subprocess(
     """
     Execute subprocess and log command as well as stdout/stderr.
 
+    When no stdin data is given, stdout is read and logged line-by-line as the process produces
+    it, so long commands show progress and we never buffer the full output just for logging.
+
     Args:
         stdin_data (bytes): Data to pass to stdin
         log_stdout (bool): Write process stdout to the logger?
@@ -52,42 +62,61 @@ def execute_subprocess(
     Raises:
         subprocess.CalledProcessError: If the return code is nonzero
     """
-    if stdin_data is not None:
-        stdin_data_encoded = stdin_data.encode("utf-8")
-    else:
-        stdin_data_encoded = bytes()
+    # Don't join the command string unless it's actually going to be logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Subprocess: %s", " ".join(cmd) if isinstance(cmd, (tuple, list)) else cmd)
 
-    cmd_str = " ".join(cmd) if isinstance(cmd, (tuple, list)) else cmd
-    logger.debug(f"Subprocess: {cmd_str}")
+    stream_output = stdin_data is None and log_stdout and logger.isEnabledFor(logging.INFO)
 
     with subprocess.Popen(
         cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, **kwargs
     ) as proc:
-        (stdout, _) = proc.communicate(stdin_data_encoded)
-        return_code = proc.returncode
-
-    going_to_log_to_err = return_code != 0 and log_stdout_to_error_on_error
-
-    stdout_decoded = stdout.decode("utf-8")
-    if stdout_decoded and log_stdout and not going_to_log_to_err:
+        if stream_output:
+            assert proc.stdin is not None
+            assert proc.stdout is not None
+            # There's no stdin data, so close the pipe up front - children that read stdin must
+            # see EOF rather than block forever waiting on it
+            proc.stdin.close()
+            lines = []
+            for line_bytes in proc.stdout:
+                line = line_bytes.decode("utf-8", errors="replace")
+                lines.append(line)
+                logger.info(line.rstrip("\n"))
+            stdout_decoded = "".join(lines)
+            return_code = proc.wait()
+        else:
+            stdin_data_encoded = stdin_data.encode("utf-8") if stdin_data is not None else bytes()
+            (stdout, _) = proc.communicate(stdin_data_encoded)
+            stdout_decoded = stdout.decode("utf-8", errors="replace")
+            return_code = proc.returncode
+
+    if return_code != 0 and log_stdout_to_error_on_error:
+        if stream_output:
+            # The output was already logged as it streamed by
+            logger.error(f"Subprocess {cmd} exited with code: {return_code}.")
+        else:
+            logger.error(
+                f"Subprocess {cmd} exited with code: {return_code}.  Output:\n{stdout_decoded}"
+            )
+    elif not stream_output and stdout_decoded and log_stdout:
         logger.info(stdout_decoded)
 
-    if going_to_log_to_err:
-        logger.error(
-            f"Subprocess {cmd} exited with code: {return_code}.  Output:\n{stdout_decoded}"
-        )
-
     if return_code != 0:
         raise subprocess.CalledProcessError(return_code, cmd, stdout_decoded)
 
     return stdout_decoded
 
 
+# Compiled once at import - these run per identifier in the code generators
+_CAMELCASE_BOUNDARY_RE = re.compile(r"(?<!^)(?=[A-Z][a-z])")
+_UNDERSCORES_RE = re.compile("_+")
+
+
 def camelcase_to_snakecase(s: str) -> str:
     """
     Convert CamelCase -> snake_case.
     """
-    return re.sub(r"(?<!^)(?=[A-Z][a-z])", "_", s).lower()
+    return _CAMELCASE_BOUNDARY_RE.sub("_", s).lower()
 
 
 def snakecase_to_camelcase(s: str) -> str:
@@ -97,7 +126,7 @@ def snakecase_to_camelcase(s: str) -> str:
     Double underscores are escaped, e.g. one__two becomes One_Two
     """
     return (
-        re.sub("_+", lambda match: "_" * (len(match.group()) // 2) + " ", s)
+        _UNDERSCORES_RE.sub(lambda match: "_" * (len(match.group()) // 2) + " ", s)
         .title()
         .replace(" ", "")
     )
@@ -151,13 +180,24 @@ def files_in_dir(dirname: T.Openable, relative: bool = False) -> T.Iterator[str]
     """
     Return a list of files in the given directory.
     """
-    for root, _, filenames in os.walk(os.fspath(dirname)):
-        for filename in filenames:
-            abspath = os.path.join(root, filename)
-            if relative:
-                yield os.path.relpath(abspath, dirname)
-            else:
-                yield abspath
+
+    def walk(path: str) -> T.Iterator[str]:
+        # os.scandir avoids the extra stat syscalls and intermediate lists of os.walk
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from walk(entry.path)
+                elif not entry.is_dir():
+                    # Like os.walk, don't yield (or follow) symlinks to directories
+                    yield entry.path
+
+    root = os.fspath(dirname)
+    if relative:
+        prefix_len = len(os.path.join(root, ""))
+        for abspath in walk(root):
+            yield abspath[prefix_len:]
+    else:
+        yield from walk(root)
 
 
 def id_generator(size: int = 6, chars: str = string.ascii_uppercase + string.digits) -> str:
@@ -7,6 +7,7 @@ import numpy as np
 
 import symforce
 import symforce.symbolic as sf
+from symforce import typing as T
 from symforce.test_util import TestCase
 from symforce.test_util import epsilon_handling
 from symforce.test_util import expected_failure_on_sympy
@@ -250,6 +251,34 @@ class GeoMatrixTest(LieGroupOpsTestMixin, TestCase):
         vec = mat[:, 0]
         self.assertRaises(AssertionError, lambda: mat.jacobian(vec))
 
+    def test_are_parallel(self) -> None:
+        """
+        Tests:
+            Matrix.are_parallel
+            Matrix.are_parallel_expr
+        """
+        self.assertEqual(sf.Matrix.are_parallel(sf.V3(1, 0, 0), sf.V3(2, 0, 0), 0.1), 1)
+        self.assertEqual(sf.Matrix.are_parallel(sf.V3(1, 0, 0), sf.V3(0, 1, 0), 0.1), 0)
+
+        a = sf.V3.symbolic("a")
+        b = sf.V3.symbolic("b")
+
+        # Without a cache, are_parallel_expr matches are_parallel
+        self.assertEqual(sf.Matrix.are_parallel_expr(a, b, 0.1), sf.Matrix.are_parallel(a, b, 0.1))
+
+        # With a cache, the cross product for the pair is computed once and reused
+        cache: T.Dict[T.Tuple[int, int], sf.V3] = {}
+        expr = sf.Matrix.are_parallel_expr(a, b, 0.1, cache=cache)
+        self.assertEqual(expr, sf.Matrix.are_parallel(a, b, 0.1))
+        self.assertEqual(len(cache), 1)
+        (cross,) = cache.values()
+        self.assertEqual(cross, a.cross(b))
+
+        sf.Matrix.are_parallel_expr(a, b, 0.2, cache=cache)
+        self.assertEqual(len(cache), 1)
+        (cross_again,) = cache.values()
+        self.assertIs(cross_again, cross)
+
     def test_block_matrix(self) -> None:
         """
         Tests:
@@ -3,6 +3,11 @@
 # This source code is under the Apache 2.0 license found in the LICENSE file.
 # ----------------------------------------------------------------------------
 
+import logging
+import subprocess
+import sys
+
+from symforce import logger
 from symforce import python_util
 from symforce.test_util import TestCase
 
@@ -12,6 +17,36 @@ class SymforceUtilTest(TestCase):
     Tests python_util.py
     """
 
+    def test_execute_subprocess(self) -> None:
+        """
+        Tests:
+            python_util.execute_subprocess
+        """
+        cat_cmd = [sys.executable, "-c", "import sys; sys.stdout.write(sys.stdin.read())"]
+
+        with self.subTest("Output is returned on the streaming (INFO-logging) path"):
+            original_level = logger.level
+            logger.setLevel(logging.INFO)
+            try:
+                self.assertEqual(
+                    python_util.execute_subprocess([sys.executable, "-c", "print('hello')"]),
+                    "hello\n",
+                )
+                # A child that reads stdin must see EOF instead of blocking on the unused pipe
+                self.assertEqual(python_util.execute_subprocess(cat_cmd), "")
+            finally:
+                logger.setLevel(original_level)
+
+        with self.subTest("stdin data is passed through"):
+            self.assertEqual(python_util.execute_subprocess(cat_cmd, stdin_data="abc"), "abc")
+
+        with self.subTest("Raises CalledProcessError on nonzero return code"):
+            with self.assertRaises(subprocess.CalledProcessError):
+                python_util.execute_subprocess(
+                    [sys.executable, "-c", "import sys; sys.exit(1)"],
+                    log_stdout_to_error_on_error=False,
+                )
+
     def test_snakecase_to_camelcase(self) -> None:
         """
         Tests: